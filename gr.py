@@ -1,14 +1,103 @@
 import gradio as gr
 import pandas as pd
-from store import StoreApp
+import numpy as np
+from store import INVENTORY_CACHE_TTL, StoreApp
 import os
+import sys
+import atexit
+import functools
+import logging
+import queue
+import threading
+import time
 from datetime import datetime
 
+class ActionLogger:
+    """Appends action lines to a flag file from a background writer thread, rotating it at max_bytes."""
+    _STOP = object()
+
+    def __init__(self, path: str = "action_flag.txt", batch_size: int = 256, buffer_size: int = 1 << 20,
+                 max_bytes: int = 1 << 20):
+        self.path = path
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self._q = queue.Queue()
+        # Raw append-only fd plus a reusable byte buffer: no text layer, one write() per batch.
+        self._open()
+        self._buf = bytearray(buffer_size)
+        self._len = 0
+        self._thread = threading.Thread(target=self._drain, name="ActionLogger", daemon=True)
+        self._thread.start()
+
+    def log(self, action: str) -> None:
+        """Queues an action line; the timestamp is taken at call time."""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._q.put(f"[{timestamp}] {action}\n")
+
+    def _append(self, data: bytes) -> None:
+        if self._len + len(data) > len(self._buf):
+            self._flush()
+            if len(data) > len(self._buf):
+                self._write_all(memoryview(data))
+                return
+        self._buf[self._len:self._len + len(data)] = data
+        self._len += len(data)
+
+    def _flush(self) -> None:
+        self._write_all(memoryview(self._buf)[:self._len])
+        self._len = 0
+
+    def _write_all(self, view: memoryview) -> None:
+        while view:
+            written = os.write(self._fd, view)
+            self._size += written
+            view = view[written:]
+        if self._size >= self.max_bytes:
+            self._rotate()
+
+    def _open(self) -> None:
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._size = os.fstat(self._fd).st_size
+
+    def _rotate(self) -> None:
+        """Closes the full log, keeps it as `<path>.1` (replacing the previous one) and starts a new file."""
+        os.close(self._fd)
+        os.replace(self.path, self.path + ".1")
+        self._open()
+
+    def _drain(self) -> None:
+        while True:
+            items = [self._q.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            for item in items:
+                if item is self._STOP:
+                    stop = True
+                else:
+                    self._append(item.encode("utf-8"))
+            self._flush()
+            if stop:
+                return
+
+    def shutdown(self) -> None:
+        """Drains pending lines and closes the file."""
+        if self._thread.is_alive():
+            self._q.put(self._STOP)
+            self._thread.join()
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+action_logger = ActionLogger("action_flag.txt")
+atexit.register(action_logger.shutdown)
+
 def log_action_to_file(action: str):
     """Log performed actions to a flag file."""
-    with open("action_flag.txt", "a", encoding="utf-8") as f:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        f.write(f"[{timestamp}] {action}\n")
+    action_logger.log(action)
 
 # Initialize the app with SQLite
 app = StoreApp("store.db")
@@ -19,132 +108,152 @@ def start_app():
     except Exception as e:
         return f"❌ Database connection error: {e}"
 
-def add_new_product(name: str, price: str):
+def add_new_product(name: str, price: float):
     try:
-        price = float(price)
+        if price is None:
+            return "❌ Please enter a product price.", name, price
         product_id = app.add_new_product(name, price)
         log_action_to_file(f"ProductAdded: ID={product_id} Name={name}")
-        return f"✅ Product added with ID {product_id}.", "", ""
+        return f"✅ Product added with ID {product_id}.", "", None
     except ValueError as e:
         return f"❌ Invalid input: {e}", name, price
     except Exception as e:
         return f"❌ Error adding product: {e}", name, price
 
-def add_to_inventory(product_id: str, quantity: str):
+def add_to_inventory(product_id: int, quantity: int):
     try:
-        product_id = int(product_id)
-        quantity_ = int(quantity)
-        if quantity_ <= 0:
+        if product_id is None or quantity is None:
+            return "❌ Please enter a Product ID and quantity.", product_id, quantity
+        if quantity <= 0:
             return "❌ Quantity must be greater than zero.", product_id, quantity
 
-        if not app.store.check_product_exists(product_id):
-            return f"❌ Product ID {product_id} does not exist.", product_id, quantity
-
-        product = app.get_product_by_id(product_id)
-        product_name = product.name if product else "Unknown"
-
-        app.add_product_to_inventory(product_id, quantity_)
-        log_action_to_file(f"InventoryUpdated: ID={product_id}({product_name}) QTY={quantity_}")
-        return f"✅ {quantity_} units added to inventory for Product ID {product_id}.", "", ""
+        app.add_product_to_inventory(product_id, quantity)
+        product_name = app.get_product_name(product_id)
+        log_action_to_file(f"InventoryUpdated: ID={product_id}({product_name}) QTY={quantity}")
+        return f"✅ {quantity} units added to inventory for Product ID {product_id}.", None, None
     except ValueError as e:
         return f"❌ Invalid input: {e}", product_id, quantity
     except Exception as e:
         return f"❌ Error adding to inventory: {e}", product_id, quantity
 
-def record_store_sale(product_id: str, quantity: str):
+def record_store_sale(product_id: int, quantity: int):
     try:
-        product_id = int(product_id)
-        quantity = int(quantity)
-        
-        if not app.store.check_product_exists(product_id):
-            return f"❌ Product ID {product_id} does not exist.", product_id, quantity
-
-        if not app.storage.is_product_active(product_id):
-            return f"❌ Product ID {product_id} is inactive and cannot be sold.", product_id, quantity
-            
+        if product_id is None or quantity is None:
+            return "❌ Please enter a Product ID and quantity.", product_id, quantity
+
         if quantity <= 0:
             return "❌ Quantity must be greater than zero.", product_id, quantity
 
-        app.record_store_sale(product_id, quantity)
-        product = app.get_product_by_id(product_id)
-        product_name = product.name if product else "Unknown"
+        # Sales from concurrent sessions share one commit; missing and inactive
+        # products are rejected through the returned future.
+        app.sale_buffer.submit("store", product_id, quantity).result()
+        product_name = app.get_product_name(product_id)
         log_action_to_file(f"StoreSale: ID={product_id}({product_name}) QTY={quantity}")
-        return f"✅ Store sale recorded for Product ID {product_id}, Quantity: {quantity}.", "", ""
+        return f"✅ Store sale recorded for Product ID {product_id}, Quantity: {quantity}.", None, None
     except ValueError as e:
         return f"❌ Invalid input: {e}", product_id, quantity
     except Exception as e:
         return f"❌ Error recording store sale: {e}", product_id, quantity
 
-def record_online_sale(product_id: str, quantity: str):
+def record_online_sale(product_id: int, quantity: int):
     try:
-        product_id = int(product_id)
-        quantity = int(quantity)
-        
-        # Check if product exists
-        if not app.store.check_product_exists(product_id):
-            return f"❌ Product ID {product_id} does not exist.", product_id, quantity
-        
-        # Check if product is active
-        if not app.storage.is_product_active(product_id):
-            return f"❌ Product ID {product_id} is inactive and cannot be sold.", product_id, quantity
-            
+        if product_id is None or quantity is None:
+            return "❌ Please enter a Product ID and quantity.", product_id, quantity
+
         if quantity <= 0:
             return "❌ Quantity must be greater than zero.", product_id, quantity
 
-        app.record_online_sale(product_id, quantity)
-        product = app.get_product_by_id(product_id)
-        product_name = product.name if product else "Unknown"
+        # Sales from concurrent sessions share one commit; missing and inactive
+        # products are rejected through the returned future.
+        app.sale_buffer.submit("online", product_id, quantity).result()
+        product_name = app.get_product_name(product_id)
         log_action_to_file(f"OnlineSale: ID={product_id}({product_name}) QTY={quantity}")
-        return f"✅ Online sale recorded for Product ID {product_id}, Quantity: {quantity}.", "", ""
+        return f"✅ Online sale recorded for Product ID {product_id}, Quantity: {quantity}.", None, None
     except ValueError as e:
         return f"❌ Invalid input: {e}", product_id, quantity
     except Exception as e:
         return f"❌ Error recording online sale: {e}", product_id, quantity
+
+def bulk_upload(csv_file, target: str):
+    try:
+        if csv_file is None:
+            return "⚠️ Please choose a CSV file."
+        path = getattr(csv_file, "name", csv_file)
+        df = pd.read_csv(path, usecols=["ProductID", "Quantity"], dtype="int64")
+        rows = list(df.itertuples(index=False, name=None))
+        if not rows:
+            return "⚠️ The CSV file has no rows."
+        if target == "Inventory":
+            app.add_products_to_inventory_bulk(rows)
+        elif target == "Store Sales":
+            app.record_store_sales_bulk(rows)
+        elif target == "Online Sales":
+            app.record_online_sales_bulk(rows)
+        else:
+            return "⚠️ Invalid target selected."
+        log_action_to_file(f"BulkUpload: Target={target} Rows={len(rows)}")
+        return f"✅ {len(rows)} rows uploaded to {target}."
+    except ValueError as e:
+        return f"❌ Invalid input: {e}"
+    except Exception as e:
+        return f"❌ Error during bulk upload: {e}"
+
+INVENTORY_COLUMNS = ["Product ID", "Name", "Price", "Quantity"]
+REPORT_COLUMNS = [
+    "Product ID", "Name", "Price", "Inventory",
+    "Store Sales", "Online Sales", "Total Sales", "Availability"
+]
+
 def show_inventory():
     try:
-        inventory = app.storage.get_inventory()
-        if not inventory:
+        frames = [
+            pd.DataFrame.from_records(batch, columns=INVENTORY_COLUMNS)
+            for batch in app.storage.iter_inventory_batches()
+        ]
+        if not frames:
             return pd.DataFrame(), "⚠️ No inventory data found."
-        data = [{
-            "Product ID": product.product_id,
-            "Name": product.name,
-            "Price": f"{product.price:.2f}",
-            "Quantity": product.quantity
-        } for product in inventory]
-        return pd.DataFrame(data), "✅ Inventory loaded."
+        df = pd.concat(frames, ignore_index=True)
+        df["Price"] = df["Price"].map("{:.2f}".format)
+        return df, "✅ Inventory loaded."
     except Exception as e:
         return pd.DataFrame(), f"❌ Error loading inventory: {e}"
 
+@functools.lru_cache(maxsize=4)
+def _sales_report_frame(write_seq: int, ttl_slot: int) -> pd.DataFrame:
+    """Builds the report DataFrame; reused until the next local commit or the TTL slot changes."""
+    frames = [
+        pd.DataFrame.from_records(batch, columns=REPORT_COLUMNS)
+        for batch in app.report.iter_sales_report_batches()
+    ]
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames, ignore_index=True)
+    df["Price"] = df["Price"].map("{:.2f}".format)
+    df["Status"] = np.where(df.pop("Availability"), "Active", "Inactive")
+    return df
+
 def show_sales_report():
     try:
-        report = app.report.get_sales_report()
-        if not report:
-            return pd.DataFrame(), "⚠️ No sales data found."
-        data = [{
-            "Product ID": row[0],  # ProductID
-            "Name": row[1],       # ProductName
-            "Price": f"{row[2]:.2f}",  # Price
-            "Inventory": row[3],  # StorageQuantity
-            "Store Sales": row[4], # StoreSalesQuantity
-            "Online Sales": row[5], # OnlineSalesQuantity
-            "Total Sales": row[6], # TotalSalesQuantity
-            "Status": "Active" if row[7] else "Inactive"  # Availability
-        } for row in report]
-        return pd.DataFrame(data), "✅ Sales report loaded."
+        # write_seq only sees this process's commits; the TTL slot picks up the CLI and other writers.
+        df = _sales_report_frame(app.db.write_seq, int(time.monotonic() // INVENTORY_CACHE_TTL))
+        if df.empty:
+            return df, "⚠️ No sales data found."
+        return df, "✅ Sales report loaded."
     except Exception as e:
         return pd.DataFrame(), f"❌ Error loading sales report: {e}"
 
-def manage_product_status(product_id: str, action: str):
+def manage_product_status(product_id: int, action: str):
     try:
-        product_id = int(product_id)
+        if product_id is None:
+            return "❌ Please enter a Product ID.", product_id
         if action == "Deactivate":
             app.storage.delete_product(product_id)
-            log_action_to_file(f"ProductDeactivated: ID={product_id}")
-            return f"❌ Product ID {product_id} deactivated.", ""
+            log_action_to_file(f"ProductDeactivated: ID={product_id}({app.get_product_name(product_id)})")
+            return f"❌ Product ID {product_id} deactivated.", None
         elif action == "Activate":
             app.storage.activate_product(product_id)
-            log_action_to_file(f"ProductActivated: ID={product_id}")
-            return f"✅ Product ID {product_id} activated.", ""
+            log_action_to_file(f"ProductActivated: ID={product_id}({app.get_product_name(product_id)})")
+            return f"✅ Product ID {product_id} activated.", None
         else:
             return "⚠️ Invalid action selected.", product_id
     except ValueError as e:
@@ -164,7 +273,7 @@ with gr.Blocks(css="h1 {text-align: center;}") as demo:
 
     with gr.Tab("Add New Product"):
         name_input = gr.Textbox(label="Product Name")
-        price_input = gr.Textbox(label="Product Price")
+        price_input = gr.Number(label="Product Price")
         add_product_btn = gr.Button("Add Product")
         add_product_output = gr.Textbox(label="Result", interactive=False)
         add_product_btn.click(
@@ -174,8 +283,8 @@ with gr.Blocks(css="h1 {text-align: center;}") as demo:
         )
 
     with gr.Tab("Add to Inventory"):
-        product_id_input = gr.Textbox(label="Product ID")
-        quantity_input = gr.Textbox(label="Quantity")
+        product_id_input = gr.Number(label="Product ID", precision=0)
+        quantity_input = gr.Number(label="Quantity", precision=0)
         add_inventory_btn = gr.Button("Add to Inventory")
         add_inventory_output = gr.Textbox(label="Result", interactive=False)
         add_inventory_btn.click(
@@ -185,8 +294,8 @@ with gr.Blocks(css="h1 {text-align: center;}") as demo:
         )
 
     with gr.Tab("Record Store Sale"):
-        store_sale_product_id = gr.Textbox(label="Product ID")
-        store_sale_quantity = gr.Textbox(label="Quantity")
+        store_sale_product_id = gr.Number(label="Product ID", precision=0)
+        store_sale_quantity = gr.Number(label="Quantity", precision=0)
         store_sale_btn = gr.Button("Record Sale")
         store_sale_output = gr.Textbox(label="Result", interactive=False)
         store_sale_btn.click(
@@ -196,8 +305,8 @@ with gr.Blocks(css="h1 {text-align: center;}") as demo:
         )
 
     with gr.Tab("Record Online Sale"):
-        online_sale_product_id = gr.Textbox(label="Product ID")
-        online_sale_quantity = gr.Textbox(label="Quantity")
+        online_sale_product_id = gr.Number(label="Product ID", precision=0)
+        online_sale_quantity = gr.Number(label="Quantity", precision=0)
         online_sale_btn = gr.Button("Record Sale")
         online_sale_output = gr.Textbox(label="Result", interactive=False)
         online_sale_btn.click(
@@ -206,6 +315,14 @@ with gr.Blocks(css="h1 {text-align: center;}") as demo:
             outputs=[online_sale_output, online_sale_product_id, online_sale_quantity]
         )
 
+    with gr.Tab("Bulk Upload CSV"):
+        gr.Markdown("Upload a CSV file with `ProductID` and `Quantity` columns.")
+        bulk_file = gr.File(label="CSV File", file_types=[".csv"])
+        bulk_target = gr.Radio(choices=["Inventory", "Store Sales", "Online Sales"], value="Inventory", label="Upload To")
+        bulk_btn = gr.Button("Upload")
+        bulk_output = gr.Textbox(label="Result", interactive=False)
+        bulk_btn.click(fn=bulk_upload, inputs=[bulk_file, bulk_target], outputs=bulk_output)
+
     with gr.Tab("View Inventory"):
         inventory_btn = gr.Button("Load Inventory")
         inventory_df = gr.Dataframe(label="Current Inventory")
@@ -219,7 +336,7 @@ with gr.Blocks(css="h1 {text-align: center;}") as demo:
         report_btn.click(fn=show_sales_report, outputs=[report_df, report_output])
 
     with gr.Tab("Manage Product Status"):
-        manage_product_id = gr.Textbox(label="Product ID")
+        manage_product_id = gr.Number(label="Product ID", precision=0)
         action_choice = gr.Radio(choices=["Activate", "Deactivate"], label="Select Action")
         manage_btn = gr.Button("Submit")
         manage_output = gr.Textbox(label="Result", interactive=False)
@@ -231,6 +348,8 @@ with gr.Blocks(css="h1 {text-align: center;}") as demo:
 
 
 if __name__ == "__main__":
+    # Database operation messages from store.py; raise to WARNING to keep the console quiet.
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     try:
         demo.launch()
     finally:
@@ -1,12 +1,9 @@
 import sqlite3
-from pathlib import Path
 
 def initialize_database(db_path='store.db', schema_file='store_schema.sql'):
     """راه‌اندازی اولیه دیتابیس و ایجاد ساختارها"""
     
-    # بررسی وجود فایل دیتابیس
-    db_exists = Path(db_path).exists()
-    
+    conn = None
     try:
         # اتصال به دیتابیس (اگر وجود نداشته باشد، ساخته می‌شود)
         conn = sqlite3.connect(db_path)
@@ -15,15 +12,26 @@ def initialize_database(db_path='store.db', schema_file='store_schema.sql'):
         # فعال کردن محدودیت‌های کلید خارجی
         cursor.execute("PRAGMA foreign_keys = ON")
         
-        if not db_exists:
+        # حالت WAL و تنظیمات کارایی (یک fsync برای هر تراکنش به جای هر دستور)
+        cursor.executescript('''
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA mmap_size = 268435456;
+        ''')
+        
+        # بررسی وجود ساختار دیتابیس با یک کوئری (فایل خالی هم ساختار ندارد)
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Products'")
+        schema_exists = cursor.fetchone() is not None
+        
+        if not schema_exists:
             print("🔹 ایجاد دیتابیس جدید...")
             # خواندن فایل اسکریپت SQL
             with open(schema_file, 'r', encoding='utf-8') as f:
                 schema_script = f.read()
             
-            # اجرای اسکریپت SQL
-            cursor.executescript(schema_script)
-            conn.commit()
+            # اجرای اسکریپت SQL در یک تراکنش واحد
+            cursor.executescript(f"BEGIN;\n{schema_script}\nCOMMIT;")
             print("✅ دیتابیس با موفقیت ایجاد و مقداردهی اولیه شد.")
         else:
             print("🔹 دیتابیس از قبل وجود دارد. فقط اتصال برقرار شد.")
@@ -1,9 +1,246 @@
 import sqlite3
-from typing import List, Tuple, Optional
-from datetime import datetime
+import sys
+import functools
+import itertools
+import json
+import logging
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Set, Tuple, Optional, TextIO
 from dataclasses import dataclass
 
-@dataclass
+log = logging.getLogger(__name__)
+
+# Prepared statements kept per connection; comfortably above the number of distinct queries below.
+STATEMENT_CACHE_SIZE = 256
+# Seconds a connection waits on another writer's lock before raising "database is locked".
+BUSY_TIMEOUT = 5.0
+# Rows per page when the CLI sales report is paginated.
+REPORT_PAGE_SIZE = 50
+# Rows pulled per fetchmany() call when streaming large result sets.
+FETCH_BATCH_SIZE = 1000
+# Bound parameters per IN (...) lookup, below SQLite's historical 999-variable limit.
+IN_CLAUSE_CHUNK_SIZE = 500
+# Most sales the background writer commits together in one transaction.
+SALE_BUFFER_MAX_BATCH = 500
+# Seconds a cached inventory snapshot is trusted; commits on this connection invalidate it sooner.
+INVENTORY_CACHE_TTL = 5.0
+
+# Per-connection settings: synchronous=NORMAL is safe under WAL and syncs only at
+# checkpoints; the 64 MB page cache and 256 MB mmap keep repeat reads off the disk.
+_SQL_CONNECTION_PRAGMAS = '''
+    PRAGMA foreign_keys = ON;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    PRAGMA mmap_size = 268435456;
+'''
+
+# Objects added after the first schema release; mirrored in store_schema.sql.
+_SQL_ENSURE_SCHEMA = '''
+    CREATE UNIQUE INDEX IF NOT EXISTS IX_Storage_ProductID ON Storage(ProductID);
+    CREATE INDEX IF NOT EXISTS IX_Storage_ProductID_Quantity ON Storage(ProductID, Quantity);
+    CREATE INDEX IF NOT EXISTS IX_StoreSales_ProductID ON StoreSales(ProductID, Quantity);
+    CREATE INDEX IF NOT EXISTS IX_OnlineSales_ProductID ON OnlineSales(ProductID, Quantity);
+
+    CREATE VIEW IF NOT EXISTS StoreSalesISO AS
+    SELECT SaleID, ProductID, Quantity,
+           CASE typeof(SaleDate) WHEN 'integer' THEN datetime(SaleDate / 1000, 'unixepoch') ELSE SaleDate END AS SaleDate
+    FROM StoreSales;
+
+    CREATE VIEW IF NOT EXISTS OnlineSalesISO AS
+    SELECT SaleID, ProductID, Quantity,
+           CASE typeof(SaleDate) WHEN 'integer' THEN datetime(SaleDate / 1000, 'unixepoch') ELSE SaleDate END AS SaleDate
+    FROM OnlineSales;
+
+    CREATE TABLE IF NOT EXISTS SalesTotals (
+        ProductID INTEGER PRIMARY KEY,
+        StoreQuantity INTEGER NOT NULL DEFAULT 0,
+        OnlineQuantity INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY (ProductID) REFERENCES Products(ProductID)
+    );
+
+    CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_StoreSaleInsert
+    AFTER INSERT ON StoreSales
+    BEGIN
+        INSERT INTO SalesTotals (ProductID, StoreQuantity) VALUES (NEW.ProductID, NEW.Quantity)
+        ON CONFLICT(ProductID) DO UPDATE SET StoreQuantity = StoreQuantity + excluded.StoreQuantity;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_StoreSaleDelete
+    AFTER DELETE ON StoreSales
+    BEGIN
+        UPDATE SalesTotals SET StoreQuantity = StoreQuantity - OLD.Quantity WHERE ProductID = OLD.ProductID;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_StoreSaleUpdate
+    AFTER UPDATE OF ProductID, Quantity ON StoreSales
+    BEGIN
+        UPDATE SalesTotals SET StoreQuantity = StoreQuantity - OLD.Quantity WHERE ProductID = OLD.ProductID;
+        INSERT INTO SalesTotals (ProductID, StoreQuantity) VALUES (NEW.ProductID, NEW.Quantity)
+        ON CONFLICT(ProductID) DO UPDATE SET StoreQuantity = StoreQuantity + excluded.StoreQuantity;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_OnlineSaleInsert
+    AFTER INSERT ON OnlineSales
+    BEGIN
+        INSERT INTO SalesTotals (ProductID, OnlineQuantity) VALUES (NEW.ProductID, NEW.Quantity)
+        ON CONFLICT(ProductID) DO UPDATE SET OnlineQuantity = OnlineQuantity + excluded.OnlineQuantity;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_OnlineSaleDelete
+    AFTER DELETE ON OnlineSales
+    BEGIN
+        UPDATE SalesTotals SET OnlineQuantity = OnlineQuantity - OLD.Quantity WHERE ProductID = OLD.ProductID;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_OnlineSaleUpdate
+    AFTER UPDATE OF ProductID, Quantity ON OnlineSales
+    BEGIN
+        UPDATE SalesTotals SET OnlineQuantity = OnlineQuantity - OLD.Quantity WHERE ProductID = OLD.ProductID;
+        INSERT INTO SalesTotals (ProductID, OnlineQuantity) VALUES (NEW.ProductID, NEW.Quantity)
+        ON CONFLICT(ProductID) DO UPDATE SET OnlineQuantity = OnlineQuantity + excluded.OnlineQuantity;
+    END;
+'''
+
+# Folds duplicate Storage rows into the oldest one per product so the unique
+# ProductID index (the ON CONFLICT target of the stock upserts) can be created.
+_SQL_MERGE_DUPLICATE_STORAGE = '''
+    UPDATE Storage
+    SET Quantity = (SELECT SUM(s.Quantity) FROM Storage s WHERE s.ProductID = Storage.ProductID)
+    WHERE StorageID IN (SELECT MIN(StorageID) FROM Storage GROUP BY ProductID HAVING COUNT(*) > 1);
+    DELETE FROM Storage
+    WHERE StorageID NOT IN (SELECT MIN(StorageID) FROM Storage GROUP BY ProductID);
+'''
+
+# Seeds SalesTotals from the sales history when the rollup table is first created.
+_SQL_BACKFILL_SALES_TOTALS = '''
+    INSERT INTO SalesTotals (ProductID, StoreQuantity, OnlineQuantity)
+    SELECT ProductID, SUM(StoreQuantity), SUM(OnlineQuantity)
+    FROM (
+        SELECT ProductID, Quantity AS StoreQuantity, 0 AS OnlineQuantity FROM StoreSales
+        UNION ALL
+        SELECT ProductID, 0, Quantity FROM OnlineSales
+    )
+    GROUP BY ProductID;
+'''
+
+_SQL_INVENTORY = '''
+    SELECT p.ProductID, p.ProductName, p.Price, COALESCE(s.Quantity, 0) AS Quantity
+    FROM Products p
+    LEFT JOIN Storage s ON p.ProductID = s.ProductID
+'''
+
+_SQL_PRODUCT_BY_ID = _SQL_INVENTORY + "    WHERE p.ProductID = ?\n"
+
+_SQL_SALES_REPORT = '''
+    SELECT 
+        p.ProductID,
+        p.ProductName,
+        p.Price,
+        COALESCE(s.Quantity, 0) AS StorageQuantity,
+        COALESCE(t.StoreQuantity, 0) AS StoreSalesQuantity,
+        COALESCE(t.OnlineQuantity, 0) AS OnlineSalesQuantity,
+        COALESCE(t.StoreQuantity, 0) + COALESCE(t.OnlineQuantity, 0) AS TotalSalesQuantity,
+        p.Availability
+    FROM 
+        Products p
+    LEFT JOIN 
+        Storage s ON p.ProductID = s.ProductID
+    LEFT JOIN 
+        SalesTotals t ON p.ProductID = t.ProductID
+'''
+
+_SQL_INSERT_PRODUCT = "INSERT INTO Products (ProductName, Price, Availability) VALUES (?, ?, 1)"
+_SQL_CHECK_PRODUCT = "SELECT 1 FROM Products WHERE ProductID = ?"
+_SQL_PRODUCT_NAME = "SELECT ProductName FROM Products WHERE ProductID = ?"
+_SQL_PRODUCT_AVAILABILITY = "SELECT Availability FROM Products WHERE ProductID = ?"
+_SQL_SET_AVAILABILITY = "UPDATE Products SET Availability = ? WHERE ProductID = ?"
+
+# Sale inserts touch no row unless the product exists and is active, so a
+# successful sale needs no separate lookup; rowcount tells the caller.
+_SQL_INSERT_STORE_SALE = '''
+    INSERT INTO StoreSales (ProductID, Quantity)
+    SELECT ?1, ?2 WHERE EXISTS (SELECT 1 FROM Products WHERE ProductID = ?1 AND Availability = 1)
+'''
+_SQL_INSERT_ONLINE_SALE = '''
+    INSERT INTO OnlineSales (ProductID, Quantity)
+    SELECT ?1, ?2 WHERE EXISTS (SELECT 1 FROM Products WHERE ProductID = ?1 AND Availability = 1)
+'''
+
+# Upserts one (ProductID, Quantity) pair; touches no row when the product does not exist.
+_SQL_UPSERT_STORAGE = '''
+    INSERT INTO Storage (ProductID, Quantity)
+    SELECT ProductID, ?2 FROM Products WHERE ProductID = ?1
+    ON CONFLICT(ProductID) DO UPDATE SET Quantity = Quantity + excluded.Quantity
+'''
+
+# Upserts a whole batch passed as one JSON array of [ProductID, Quantity] pairs.
+# Duplicate IDs are summed first and unknown IDs are dropped by the join.
+_SQL_UPSERT_STORAGE_BATCH = '''
+    INSERT INTO Storage (ProductID, Quantity)
+    SELECT p.ProductID, SUM(json_extract(r.value, '$[1]'))
+    FROM json_each(?) r
+    JOIN Products p ON p.ProductID = json_extract(r.value, '$[0]')
+    GROUP BY p.ProductID
+    ON CONFLICT(ProductID) DO UPDATE SET Quantity = Quantity + excluded.Quantity
+'''
+
+@functools.lru_cache(maxsize=None)
+def _sql_active_products_in(count: int) -> str:
+    """Builds the active-product IN lookup for `count` IDs; at most IN_CLAUSE_CHUNK_SIZE variants."""
+    return f"SELECT ProductID FROM Products WHERE Availability = 1 AND ProductID IN ({', '.join('?' * count)})"
+
+@functools.lru_cache(maxsize=None)
+def _sql_sales_report(after_id: bool, product_id: bool, min_total: bool, limit: bool) -> str:
+    """Builds the sales report query for one combination of filters; parameters bind in this order."""
+    conditions = []
+    if after_id:
+        conditions.append("p.ProductID > ?")
+    if product_id:
+        conditions.append("p.ProductID = ?")
+    if min_total:
+        conditions.append("COALESCE(t.StoreQuantity, 0) + COALESCE(t.OnlineQuantity, 0) >= ?")
+    query = _SQL_SALES_REPORT
+    if conditions:
+        query += "    WHERE " + " AND ".join(conditions) + "\n"
+    query += "    ORDER BY p.ProductID\n"
+    if limit:
+        query += "    LIMIT ?\n"
+    return query
+
+# Validators for numeric menu input, checked before conversion so bad input gets a clear message.
+_INT_RE = re.compile(r"\s*[+-]?\d+\s*")
+_FLOAT_RE = re.compile(r"\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*")
+
+def _read_int(prompt: str, default: Optional[int] = None) -> int:
+    """Prompts for a whole number; an empty answer gives `default` when one is set."""
+    text = input(prompt)
+    if default is not None and not text.strip():
+        return default
+    if not _INT_RE.fullmatch(text):
+        raise ValueError(f"{text.strip()!r} is not a whole number.")
+    return int(text)
+
+def _read_float(prompt: str) -> float:
+    """Prompts for a decimal number."""
+    text = input(prompt)
+    if not _FLOAT_RE.fullmatch(text):
+        raise ValueError(f"{text.strip()!r} is not a number.")
+    return float(text)
+
+# Line templates for the CLI displays, bound once instead of re-evaluating f-strings per row.
+_INVENTORY_LINE = "ProductID: {0.product_id}, Name: {0.name}, Price: {0.price}, Quantity: {0.quantity}\n".format
+_REPORT_LINE = ("ProductID: {}, Name: {}, Price: {}, Storage: {}, Store Sales: {}, "
+                "Online Sales: {}, Total Sales: {}, Status: {}\n").format
+# Status labels indexed by the Availability flag (0 or 1).
+_STATUS_LABELS = ("🚫 Inactive", "✅ Active")
+
+@dataclass(slots=True, frozen=True)
 class Product:
     """Represents a product in the store."""
     product_id: int
@@ -11,221 +248,564 @@ class Product:
     price: float
     quantity: int
 
+def _product_row(cursor: sqlite3.Cursor, row: Tuple) -> Product:
+    """Cursor row_factory that builds a Product from an inventory row."""
+    return Product(*row)
+
 class DatabaseConnection:
-    """Manages connection to SQLite database."""
+    """Manages per-thread connections to the SQLite database."""
     def __init__(self, db_path: str = "store.db"):
         self.db_path = db_path
-        self.conn = None
-        self.cursor = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Serializes this process's writers in Python so they queue on a lock instead of
+        # polling SQLite's busy handler; readers stay lock-free on their own WAL snapshots.
+        self._write_lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._generation = 0
+        self._connected = False
+        # Bumped on every commit so callers can cache reads until the next write.
+        self.write_seq = 0
+
+    def _open(self) -> sqlite3.Connection:
+        """Opens a connection owned by the calling thread."""
+        # Autocommit mode: transaction() issues BEGIN/COMMIT itself, so a batch of
+        # writes pays for a single journal sync instead of one per statement.
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=False,
+                               isolation_level=None, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.executescript(_SQL_CONNECTION_PRAGMAS)
+        with self._lock:
+            self._connections.append(conn)
+        self._local.conn = conn
+        self._local.cursor = conn.cursor()
+        self._local.cursor.arraysize = FETCH_BATCH_SIZE
+        self._local.tx_depth = 0
+        self._local.generation = self._generation
+        return conn
+
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """The calling thread's connection, opened on first use after connect()."""
+        if not self._connected:
+            return None
+        if getattr(self._local, "generation", None) != self._generation:
+            return self._open()
+        return self._local.conn
+
+    @property
+    def cursor(self) -> Optional[sqlite3.Cursor]:
+        """The calling thread's long-lived cursor."""
+        if self.conn is None:
+            return None
+        return self._local.cursor
 
     def connect(self) -> None:
         """Establishes connection to the database."""
         try:
-            self.conn = sqlite3.connect(self.db_path,check_same_thread=False)
-            self.cursor = self.conn.cursor()
-            print("Successfully connected to SQLite database.")
-            # Enable foreign key constraints
-            self.cursor.execute("PRAGMA foreign_keys = ON")
+            self._connected = True
+            # WAL is stored in the database file, so one switch covers every later connection.
+            self._open().execute("PRAGMA journal_mode = WAL")
+            log.info("Successfully connected to SQLite database.")
+            self.ensure_schema()
         except sqlite3.Error as e:
-            print(f"Connection error: {e}")
+            self._connected = False
+            log.error("Connection error: %s", e)
             raise
 
+    def ensure_schema(self) -> None:
+        """Creates indexes and rollup objects missing from databases built with an older schema."""
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'SalesTotals'")
+        backfill = "" if self.cursor.fetchone() else _SQL_BACKFILL_SALES_TOTALS
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'IX_Storage_ProductID'")
+        dedupe = "" if self.cursor.fetchone() else _SQL_MERGE_DUPLICATE_STORAGE
+        # One transaction, so no sale can slip in between the backfill and the triggers.
+        self.cursor.executescript(f"BEGIN;\n{dedupe}\n{_SQL_ENSURE_SCHEMA}\n{backfill}\nCOMMIT;")
+        # Gather planner statistics once; PRAGMA optimize on close keeps them current.
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if self.cursor.fetchone() is None:
+            self.cursor.execute("ANALYZE")
+        self.commit()
+
+    def iter_batches(self, query: str, params: Tuple = (), row_factory=None) -> Iterator[List]:
+        """Runs a query on its own cursor and yields the rows FETCH_BATCH_SIZE at a time.
+
+        A row_factory, if given, is set on that cursor only, so rows are converted as they are fetched.
+        """
+        cursor = self.conn.cursor()
+        cursor.arraysize = FETCH_BATCH_SIZE
+        cursor.row_factory = row_factory
+        try:
+            cursor.execute(query, params)
+            while True:
+                batch = cursor.fetchmany()
+                if not batch:
+                    break
+                yield batch
+        finally:
+            cursor.close()
+
     def close(self) -> None:
-        """Closes cursor and connection."""
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
-            print("Database connection closed.")
+        """Closes the connections opened by every thread."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        was_connected, self._connected = self._connected, False
+        for conn in connections:
+            conn.execute("PRAGMA optimize")
+            conn.close()
+        if was_connected:
+            log.info("Database connection closed.")
 
     def commit(self) -> None:
         """Commits the current transaction."""
         if self.conn:
             self.conn.commit()
+            with self._lock:
+                self.write_seq += 1
+
+    def rollback(self) -> None:
+        """Rolls back the current transaction."""
+        if self.conn:
+            self.conn.rollback()
+
+    @contextmanager
+    def transaction(self):
+        """Commits once when the outermost block exits; rolls back on any error.
+
+        A nested block runs in a savepoint, so its failure undoes only its own work.
+        """
+        cursor = self.cursor
+        depth = self._local.tx_depth
+        outermost = depth == 0
+        savepoint = f"sp_{depth}"
+        if outermost:
+            # Wait no longer than SQLite itself would for another process's write lock.
+            if not self._write_lock.acquire(timeout=BUSY_TIMEOUT):
+                raise sqlite3.OperationalError("database is locked")
+            try:
+                # Take the database write lock up front rather than upgrading a read lock mid-transaction.
+                cursor.execute("BEGIN IMMEDIATE")
+            except BaseException:
+                self._write_lock.release()
+                raise
+        else:
+            cursor.execute(f"SAVEPOINT {savepoint}")
+        self._local.tx_depth += 1
+        try:
+            try:
+                yield cursor
+            except BaseException:
+                self._local.tx_depth -= 1
+                if outermost:
+                    self.rollback()
+                elif self.conn.in_transaction:
+                    # Some errors make SQLite abort the whole transaction; then there is nothing to undo here.
+                    cursor.execute(f"ROLLBACK TO {savepoint}")
+                    cursor.execute(f"RELEASE {savepoint}")
+                raise
+            self._local.tx_depth -= 1
+            if outermost:
+                self.commit()
+            else:
+                cursor.execute(f"RELEASE {savepoint}")
+        finally:
+            if outermost:
+                self._write_lock.release()
 
 class StorageManager:
     """Manages storage operations."""
     def __init__(self, db: DatabaseConnection):
         self.db = db
+        # (write_seq, loaded_at, products, products_by_id)
+        self._inventory_cache: Optional[Tuple[int, float, List[Product], Dict[int, Product]]] = None
+        # Products are only ever deactivated, never deleted, so a committed ProductID stays valid.
+        self._known_product_ids: Set[int] = set()
+        # ProductID -> ProductName for committed products; names are never edited.
+        self._product_names: Dict[int, str] = {}
 
     def add_product(self, product_id: int, quantity: int) -> None:
-        """Adds or updates product quantity in Storage."""
-        check_query = "SELECT 1 FROM Storage WHERE ProductID = ?"
-        self.db.cursor.execute(check_query, (product_id,))
-        exists = self.db.cursor.fetchone()
-        
-        if exists:
-            update_query = "UPDATE Storage SET Quantity = Quantity + ? WHERE ProductID = ?"
-            self.db.cursor.execute(update_query, (quantity, product_id))
-        else:
-            insert_query = "INSERT INTO Storage (ProductID, Quantity) VALUES (?, ?)"
-            self.db.cursor.execute(insert_query, (product_id, quantity))
-            
-        self.db.commit()
-        print(f"Added {quantity} units of ProductID {product_id} to Storage.")
+        """Adds or updates product quantity in Storage; raises ValueError if the product does not exist."""
+        with self.db.transaction():
+            self.db.cursor.execute(_SQL_UPSERT_STORAGE, (product_id, quantity))
+            if self.db.cursor.rowcount == 0:
+                raise ValueError(f"Product ID {product_id} does not exist.")
+        log.info("Added %s units of ProductID %s to Storage.", quantity, product_id)
+
+    def add_products_bulk(self, rows: List[Tuple[int, int]]) -> None:
+        """Adds or updates many (ProductID, Quantity) pairs in Storage in one set-based statement."""
+        if any(quantity <= 0 for _, quantity in rows):
+            raise ValueError("Quantity must be greater than 0.")
+        if not rows:
+            return
+        try:
+            with self.db.transaction():
+                self.db.cursor.execute(_SQL_UPSERT_STORAGE_BATCH, (json.dumps(rows),))
+                if self.db.cursor.rowcount < len({product_id for product_id, _ in rows}):
+                    raise ValueError("One or more ProductIDs in the batch do not exist.")
+            log.info("Added %s Storage rows in one batch.", len(rows))
+        except sqlite3.Error as e:
+            log.error("Error adding products in bulk: %s", e)
+            raise
+
+    def iter_inventory_batches(self, row_factory=None) -> Iterator[List]:
+        """Streams current inventory rows in batches of FETCH_BATCH_SIZE."""
+        try:
+            yield from self.db.iter_batches(_SQL_INVENTORY, row_factory=row_factory)
+        except sqlite3.Error as e:
+            log.error("Error retrieving inventory: %s", e)
+            raise
+
+    def _fresh_inventory_cache(self) -> Optional[Tuple[int, float, List[Product], Dict[int, Product]]]:
+        """Returns the cached inventory if no write or TTL has invalidated it."""
+        cache = self._inventory_cache
+        if cache is None or cache[0] != self.db.write_seq or time.monotonic() - cache[1] > INVENTORY_CACHE_TTL:
+            return None
+        return cache
 
     def get_inventory(self) -> List[Product]:
         """Retrieves current inventory from Storage."""
-        query = '''
-            SELECT p.ProductID, p.ProductName, p.Price, COALESCE(s.Quantity, 0) AS Quantity
-            FROM Products p
-            LEFT JOIN Storage s ON p.ProductID = s.ProductID
-        '''
+        return list(self.iter_inventory())
+
+    def iter_inventory(self) -> Iterator[Product]:
+        """Yields inventory products one at a time, streaming from the database unless cached."""
+        cache = self._fresh_inventory_cache()
+        if cache is not None:
+            yield from cache[2]
+            return
+        # Taken before the query so a write that lands mid-stream leaves the snapshot stale.
+        seq, now = self.db.write_seq, time.monotonic()
+        products: List[Product] = []
+        for batch in self.iter_inventory_batches(_product_row):
+            products.extend(batch)
+            yield from batch
+        # Only a fully drained stream is a complete snapshot.
+        self._inventory_cache = (seq, now, products, {product.product_id: product for product in products})
+
+    def get_product(self, product_id: int) -> Optional[Product]:
+        """Looks up one product, from the inventory cache when fresh, else by primary key."""
+        cache = self._fresh_inventory_cache()
+        if cache is not None:
+            return cache[3].get(product_id)
         try:
-            self.db.cursor.execute(query)
-            rows = self.db.cursor.fetchall()
-            return [Product(row[0], row[1], row[2], row[3]) for row in rows]
+            row = self.db.cursor.execute(_SQL_PRODUCT_BY_ID, (product_id,)).fetchone()
         except sqlite3.Error as e:
-            print(f"Error retrieving inventory: {e}")
+            log.error("Error retrieving product: %s", e)
             raise
+        return Product(*row) if row else None
 
     def add_new_product(self, name: str, price: float) -> int:
         """Add a new product to the Products table and return its ID."""
-        query = '''
-            INSERT INTO Products (ProductName, Price, Availability)
-            VALUES (?, ?, 1)
-        '''
         try:
-            self.db.cursor.execute(query, (name, price))
-            self.db.commit()
-            product_id = self.db.cursor.lastrowid
-            print(f"Added new product: {name} with ID {product_id}.")
+            with self.db.transaction():
+                product_id = self.db.cursor.execute(_SQL_INSERT_PRODUCT, (name, price)).lastrowid
+            log.info("Added new product: %s with ID %s.", name, product_id)
             return int(product_id)
         except sqlite3.Error as e:
-            print(f"Error adding new product: {e}")
+            log.error("Error adding new product: %s", e)
+            raise
+
+    def add_new_products_bulk(self, products: List[Tuple[str, float]]) -> List[int]:
+        """Adds many (ProductName, Price) products with a single commit and returns their IDs."""
+        try:
+            with self.db.transaction():
+                product_ids = [int(self.db.cursor.execute(_SQL_INSERT_PRODUCT, product).lastrowid)
+                               for product in products]
+            log.info("Added %s new products in one batch.", len(product_ids))
+            return product_ids
+        except sqlite3.Error as e:
+            log.error("Error adding new products in bulk: %s", e)
             raise
 
+    def get_product_name(self, product_id: int) -> Optional[str]:
+        """Returns the ProductName for a ProductID, or None if it does not exist."""
+        name = self._product_names.get(product_id)
+        if name is not None:
+            return name
+        cache = self._fresh_inventory_cache()
+        product = cache[3].get(product_id) if cache is not None else None
+        if product is not None:
+            name = product.name
+        else:
+            # A miss may be a product another connection added since the snapshot, so ask the database.
+            self.db.cursor.execute(_SQL_PRODUCT_NAME, (product_id,))
+            row = self.db.cursor.fetchone()
+            if row is None:
+                return None
+            name = row[0]
+        # A rolled-back insert frees its ProductID for reuse, so only remember committed names.
+        if not self.db.conn.in_transaction:
+            self._product_names[product_id] = name
+        return name
+
+    def check_product_exists(self, product_id: int) -> bool:
+        """Checks whether the ProductID exists in the Products table."""
+        if product_id in self._known_product_ids:
+            return True
+        self.db.cursor.execute(_SQL_CHECK_PRODUCT, (product_id,))
+        exists = self.db.cursor.fetchone() is not None
+        # Inside an open transaction the row could still be rolled back, so don't remember it yet.
+        if exists and not self.db.conn.in_transaction:
+            self._known_product_ids.add(product_id)
+        return exists
+
     def is_product_active(self, product_id: int) -> bool:
-        query = "SELECT Availability FROM Products WHERE ProductID = ?"
-        self.db.cursor.execute(query, (product_id,))
+        """Checks whether the product exists and is available for sale."""
+        self.db.cursor.execute(_SQL_PRODUCT_AVAILABILITY, (product_id,))
         row = self.db.cursor.fetchone()
-        return row and row[0] == 1
+        return row is not None and row[0] == 1
+
+    def unsellable_products(self, product_ids: Set[int]) -> Set[int]:
+        """Returns the given ProductIDs that are missing or inactive, using one query per chunk."""
+        pending = set(product_ids)
+        ids = list(pending)
+        for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            self.db.cursor.execute(_sql_active_products_in(len(chunk)), chunk)
+            pending.difference_update(row[0] for row in self.db.cursor.fetchall())
+        return pending
 
     def delete_product(self, product_id: int) -> None:
-        query = "UPDATE Products SET Availability = 0 WHERE ProductID = ?"
         try:
-            self.db.cursor.execute(query, (product_id,))
-            self.db.commit()
-            print(f"❌ ProductID {product_id} marked as inactive.")
+            with self.db.transaction():
+                self.db.cursor.execute(_SQL_SET_AVAILABILITY, (0, product_id))
+            log.info("❌ ProductID %s marked as inactive.", product_id)
         except sqlite3.Error as e:
-            print(f"Error deactivating product: {e}")
+            log.error("Error deactivating product: %s", e)
             raise
 
     def activate_product(self, product_id: int) -> None:
         """Marks a product as active (Available)."""
-        query = "UPDATE Products SET Availability = 1 WHERE ProductID = ?"
         try:
-            self.db.cursor.execute(query, (product_id,))
-            self.db.commit()
-            print(f"✅ ProductID {product_id} marked as active.")
+            with self.db.transaction():
+                self.db.cursor.execute(_SQL_SET_AVAILABILITY, (1, product_id))
+            log.info("✅ ProductID %s marked as active.", product_id)
         except sqlite3.Error as e:
-            print(f"Error activating product: {e}")
+            log.error("Error activating product: %s", e)
             raise
 
+def _validate_sale_rows(rows: List[Tuple[int, int]]) -> None:
+    """Raises ValueError if any sale row has a bad quantity."""
+    if any(quantity <= 0 for _, quantity in rows):
+        raise ValueError("Quantity must be greater than 0.")
+
+def _unsellable_error(storage: StorageManager, product_ids: Set[int]) -> ValueError:
+    """Explains why a guarded sale insert skipped rows; only runs on the failure path."""
+    if len(product_ids) == 1:
+        # One lookup tells a missing product (no row) from an inactive one.
+        (product_id,) = product_ids
+        exists = storage.db.cursor.execute(_SQL_PRODUCT_AVAILABILITY, (product_id,)).fetchone() is not None
+    else:
+        product_id = min(storage.unsellable_products(product_ids))
+        exists = storage.check_product_exists(product_id)
+    if not exists:
+        return ValueError(f"The product with ID {product_id} does not exist in the products table.")
+    return ValueError(f"The product with ID {product_id} is inactive and cannot be sold.")
+
 class StoreManager:
-    def __init__(self, db: DatabaseConnection):
+    def __init__(self, db: DatabaseConnection, storage: Optional[StorageManager] = None):
         self.db = db
-        self.storage = StorageManager(db)
+        self.storage = storage or StorageManager(db)
 
-    def check_product_exists(self, product_id: int) -> bool:
-        "Checks whether the ProductID exists in the Products table."
-        query = "SELECT 1 FROM Products WHERE ProductID = ?"
-        self.db.cursor.execute(query, (product_id,))
-        return self.db.cursor.fetchone() is not None
-
-    def record_sale(self, product_id: int, quantity: int):
-        if not self.storage.is_product_active(product_id):
-            print(f"❌ Product {product_id} is inactive and cannot be sold.")
-            return
-        if not self.storage.is_product_active(product_id):
-            raise ValueError(f"The product with ID {product_id} is inactive and cannot be sold.")
+    def record_sale(self, product_id: int, quantity: int) -> None:
+        """Records one store sale; the insert itself rejects missing and inactive products."""
         if quantity <= 0:
-            print("❌ Quantity must be greater than 0.")
-            return
+            raise ValueError("Quantity must be greater than 0.")
+
+        try:
+            with self.db.transaction():
+                if self.db.cursor.execute(_SQL_INSERT_STORE_SALE, (product_id, quantity)).rowcount == 0:
+                    raise _unsellable_error(self.storage, {product_id})
+            log.info("✅ Store sale recorded for ProductID %s, Quantity: %s", product_id, quantity)
+        except sqlite3.Error as e:
+            log.error("❌ Error recording store sale: %s", e)
+            raise
 
-        query = '''
-            INSERT INTO StoreSales (ProductID, Quantity, SaleDate)
-            VALUES (?, ?, ?)
-        '''
+    def record_sales_bulk(self, rows: List[Tuple[int, int]]) -> None:
+        """Records many (ProductID, Quantity) store sales with a single commit."""
+        _validate_sale_rows(rows)
+        if not rows:
+            return
         try:
-            self.db.cursor.execute(query, (product_id, quantity, datetime.now().isoformat()))
-            self.db.commit()
-            print(f"✅ Store sale recorded for ProductID {product_id}, Quantity: {quantity}")
+            with self.db.transaction():
+                if self.db.cursor.executemany(_SQL_INSERT_STORE_SALE, rows).rowcount < len(rows):
+                    raise _unsellable_error(self.storage, {product_id for product_id, _ in rows})
+            log.info("✅ %s store sales recorded in one batch.", len(rows))
         except sqlite3.Error as e:
-            print(f"❌ Error recording store sale: {e}")
+            log.error("❌ Error recording store sales: %s", e)
             raise
 
 class OnlineShopManager:
     """Manages online shop sales."""
-    def __init__(self, db: DatabaseConnection):
+    def __init__(self, db: DatabaseConnection, storage: Optional[StorageManager] = None):
         self.db = db
-        self.storage = StorageManager(db)
+        self.storage = storage or StorageManager(db)
 
     def record_sale(self, product_id: int, quantity: int) -> None:
-        if not self.check_product_exists(product_id):
-            raise ValueError(f"The product with ID {product_id} does not exist in the products table.")
-        if not self.storage.is_product_active(product_id):
-            raise ValueError(f"The product with ID {product_id} is inactive and cannot be sold.")
+        """Records one online sale; the insert itself rejects missing and inactive products."""
         if quantity <= 0:
             raise ValueError("Quantity must be greater than 0.")
 
-        query = '''
-            INSERT INTO OnlineSales (ProductID, Quantity, SaleDate)
-            VALUES (?, ?, ?)
-        '''
         try:
-            self.db.cursor.execute(query, (product_id, quantity, datetime.now().isoformat()))
-            self.db.commit()
-            print(f"✅ Online sale recorded for ProductID {product_id}, Quantity: {quantity}")
+            with self.db.transaction():
+                if self.db.cursor.execute(_SQL_INSERT_ONLINE_SALE, (product_id, quantity)).rowcount == 0:
+                    raise _unsellable_error(self.storage, {product_id})
+            log.info("✅ Online sale recorded for ProductID %s, Quantity: %s", product_id, quantity)
         except sqlite3.Error as e:
-            print(f"❌ Error recording online sale: {e}")
+            log.error("❌ Error recording online sale: %s", e)
             raise
 
-    def check_product_exists(self, product_id: int) -> bool:
-        query = "SELECT 1 FROM Products WHERE ProductID = ?"
-        self.db.cursor.execute(query, (product_id,))
-        return self.db.cursor.fetchone() is not None
+    def record_sales_bulk(self, rows: List[Tuple[int, int]]) -> None:
+        """Records many (ProductID, Quantity) online sales with a single commit."""
+        _validate_sale_rows(rows)
+        if not rows:
+            return
+        try:
+            with self.db.transaction():
+                if self.db.cursor.executemany(_SQL_INSERT_ONLINE_SALE, rows).rowcount < len(rows):
+                    raise _unsellable_error(self.storage, {product_id for product_id, _ in rows})
+            log.info("✅ %s online sales recorded in one batch.", len(rows))
+        except sqlite3.Error as e:
+            log.error("❌ Error recording online sales: %s", e)
+            raise
 
 class ReportManager:
     """Manages reporting operations."""
     def __init__(self, db: DatabaseConnection):
         self.db = db
 
-    def get_sales_report(self) -> List[Tuple]:
-        """Generates a report combining Products, Storage, StoreSales, and OnlineSales."""
-        query = '''
-            SELECT 
-                p.ProductID,
-                p.ProductName,
-                p.Price,
-                COALESCE(s.Quantity, 0) AS StorageQuantity,
-                COALESCE((SELECT SUM(ss.Quantity) FROM StoreSales ss WHERE ss.ProductID = p.ProductID), 0) AS StoreSalesQuantity,
-                COALESCE((SELECT SUM(os.Quantity) FROM OnlineSales os WHERE os.ProductID = p.ProductID), 0) AS OnlineSalesQuantity,
-                COALESCE((SELECT SUM(ss.Quantity) FROM StoreSales ss WHERE ss.ProductID = p.ProductID), 0) + 
-                COALESCE((SELECT SUM(os.Quantity) FROM OnlineSales os WHERE os.ProductID = p.ProductID), 0) AS TotalSalesQuantity,
-                p.Availability
-            FROM 
-                Products p
-            LEFT JOIN 
-                Storage s ON p.ProductID = s.ProductID
-            ORDER BY 
-                p.ProductID;
-        '''
+    def iter_sales_report_batches(self, after_id: Optional[int] = None, limit: Optional[int] = None,
+                                  product_id: Optional[int] = None, min_total: Optional[int] = None,
+                                  row_factory=None) -> Iterator[List]:
+        """Streams the sales report rows in batches of FETCH_BATCH_SIZE.
+
+        Filters are applied in SQL. Pages are keyed on ProductID (`after_id` is the last
+        ProductID already seen) so each page is a primary-key range rather than an OFFSET scan.
+        A row_factory such as sqlite3.Row applies to this query's cursor only.
+        """
+        query = _sql_sales_report(after_id is not None, product_id is not None,
+                                  min_total is not None, limit is not None)
+        params = tuple(value for value in (after_id, product_id, min_total, limit) if value is not None)
+        try:
+            yield from self.db.iter_batches(query, params, row_factory)
+        except sqlite3.Error as e:
+            log.error("Error generating sales report: %s", e)
+            raise
+
+    def rebuild_sales_totals(self) -> None:
+        """Recomputes the SalesTotals rollup from the sales tables in one grouped pass."""
         try:
-            self.db.cursor.execute(query)
-            return self.db.cursor.fetchall()
+            with self.db.transaction():
+                self.db.cursor.execute("DELETE FROM SalesTotals")
+                self.db.cursor.execute(_SQL_BACKFILL_SALES_TOTALS)
+            log.info("✅ Sales totals rebuilt.")
         except sqlite3.Error as e:
-            print(f"Error generating sales report: {e}")
+            log.error("❌ Error rebuilding sales totals: %s", e)
             raise
 
+    def iter_sales_report(self, after_id: Optional[int] = None, limit: Optional[int] = None,
+                          product_id: Optional[int] = None, min_total: Optional[int] = None,
+                          row_factory=None) -> Iterator:
+        """Yields sales report rows one at a time without holding the whole report in memory."""
+        for batch in self.iter_sales_report_batches(after_id, limit, product_id, min_total, row_factory):
+            yield from batch
+
+    def get_sales_report(self, after_id: Optional[int] = None, limit: Optional[int] = None,
+                         product_id: Optional[int] = None, min_total: Optional[int] = None) -> List[Tuple]:
+        """Generates a report combining Products, Storage, StoreSales, and OnlineSales."""
+        return list(self.iter_sales_report(after_id, limit, product_id, min_total))
+
+class SaleBuffer:
+    """Group-commits sales submitted from many threads on one background writer thread.
+
+    The writer takes whatever is queued (up to SALE_BUFFER_MAX_BATCH sales) and records it
+    in a single transaction, so concurrent callers share one commit instead of paying for
+    one each. It never waits to fill a batch: a lone sale is written immediately.
+    """
+    _STOP = object()
+
+    def __init__(self, store: StoreManager, online_shop: OnlineShopManager,
+                 max_batch: int = SALE_BUFFER_MAX_BATCH):
+        self._managers = {"store": store, "online": online_shop}
+        self._db = store.db
+        self._max_batch = max_batch
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, channel: str, product_id: int, quantity: int) -> Future:
+        """Queues a 'store' or 'online' sale; the Future resolves once it is committed or rejected."""
+        if channel not in self._managers:
+            raise ValueError(f"Unknown sales channel {channel!r}.")
+        if quantity <= 0:
+            raise ValueError("Quantity must be greater than 0.")
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, args=(self._queue,),
+                                                name="sale-buffer", daemon=True)
+                self._thread.start()
+            self._queue.put((channel, product_id, quantity, future))
+        return future
+
+    def flush(self) -> None:
+        """Waits until every submitted sale is written, then stops the writer until the next submit."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            # Each writer owns its queue, so a submit() racing this flush starts a new writer
+            # on a fresh queue instead of sharing (and possibly taking) the old one's _STOP.
+            pending, self._queue = self._queue, queue.Queue()
+            pending.put(self._STOP)
+        thread.join()
+
+    def _run(self, pending: "queue.Queue") -> None:
+        while True:
+            batch, stop = [pending.get()], False
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+            if self._STOP in batch:
+                batch.remove(self._STOP)
+                stop = True
+            if batch:
+                self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch: List[Tuple[str, int, int, Future]]) -> None:
+        if len(batch) > 1:
+            try:
+                with self._db.transaction():
+                    for channel, manager in self._managers.items():
+                        rows = [(product_id, quantity) for c, product_id, quantity, _ in batch if c == channel]
+                        if rows:
+                            manager.record_sales_bulk(rows)
+            except Exception:
+                pass  # Fall through and retry one by one so only the bad sales fail.
+            else:
+                for *_, future in batch:
+                    future.set_result(None)
+                return
+        for channel, product_id, quantity, future in batch:
+            try:
+                self._managers[channel].record_sale(product_id, quantity)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(None)
+
 class StoreApp:
     """Main application to coordinate storage, store, online shop, and reporting operations."""
     def __init__(self, db_path: str = "store.db"):
         self.db = DatabaseConnection(db_path)
         self.storage = StorageManager(self.db)
-        self.store = StoreManager(self.db)
-        self.online_shop = OnlineShopManager(self.db)
+        self.store = StoreManager(self.db, self.storage)
+        self.online_shop = OnlineShopManager(self.db, self.storage)
         self.report = ReportManager(self.db)
+        self.sale_buffer = SaleBuffer(self.store, self.online_shop)
 
     def start(self) -> None:
         """Starts the application and connects to the database."""
@@ -233,14 +813,21 @@ class StoreApp:
 
     def stop(self) -> None:
         """Stops the application and closes the database connection."""
+        self.sale_buffer.flush()
         self.db.close()
-    
+
+    def batch(self):
+        """Groups several operations into one transaction committed when the block exits."""
+        return self.db.transaction()
+
     def get_product_by_id(self, product_id: int) -> Optional[Product]:
-        inventory = self.storage.get_inventory()
-        for product in inventory:
-            if product.product_id == product_id:
-                return product
-        return None
+        """Returns one product with its stock, or None if the ProductID does not exist."""
+        return self.storage.get_product(product_id)
+
+    def get_product_name(self, product_id: int) -> str:
+        """Returns a product's name for display, or "Unknown" if the ProductID does not exist."""
+        name = self.storage.get_product_name(product_id)
+        return name if name is not None else "Unknown"
 
     def add_product_to_inventory(self, product_id: int, quantity: int) -> None:
         """Adds a product to inventory."""
@@ -250,6 +837,14 @@ class StoreApp:
         """Adds a new product to Products table."""
         return self.storage.add_new_product(name, price)
 
+    def add_new_products_bulk(self, products: List[Tuple[str, float]]) -> List[int]:
+        """Adds many new products to the Products table at once."""
+        return self.storage.add_new_products_bulk(products)
+
+    def add_products_to_inventory_bulk(self, rows: List[Tuple[int, int]]) -> None:
+        """Adds many (ProductID, Quantity) pairs to inventory at once."""
+        self.storage.add_products_bulk(rows)
+
     def record_store_sale(self, product_id: int, quantity: int) -> None:
         """Records a sale in the store."""
         self.store.record_sale(product_id, quantity)
@@ -258,98 +853,217 @@ class StoreApp:
         """Records a sale in the online shop."""
         self.online_shop.record_sale(product_id, quantity)
 
+    def record_store_sales_bulk(self, rows: List[Tuple[int, int]]) -> None:
+        """Records many store sales at once."""
+        self.store.record_sales_bulk(rows)
+
+    def record_online_sales_bulk(self, rows: List[Tuple[int, int]]) -> None:
+        """Records many online sales at once."""
+        self.online_shop.record_sales_bulk(rows)
+
+    def rebuild_sales_totals(self) -> None:
+        """Recomputes the sales rollup from the sale tables, e.g. after editing them by hand."""
+        self.report.rebuild_sales_totals()
+
     def display_inventory(self) -> None:
-        """Displays current inventory."""
-        inventory = self.storage.get_inventory()
-        print("\nCurrent Inventory:")
-        for product in inventory:
-            print(f"ProductID: {product.product_id}, Name: {product.name}, "
-                  f"Price: {product.price}, Quantity: {product.quantity}")
-
-    def display_sales_report(self) -> None:
-        """Displays sales report."""
-        report = self.report.get_sales_report()
-        print("\nSales Report:")
-        for row in report:
-            status = "✅ Active" if row[7] else "🚫 Inactive"
-            print(f"ProductID: {row[0]}, Name: {row[1]}, "
-                  f"Price: {row[2]}, Storage: {row[3]}, "
-                  f"Store Sales: {row[4]}, Online Sales: {row[5]}, "
-                  f"Total Sales: {row[6]}, Status: {status}")
+        """Displays current inventory, writing each batch of lines to stdout at once."""
+        # The header rides along with the first batch, so a small inventory is a single write.
+        header = "\nCurrent Inventory:\n"
+        products = self.storage.iter_inventory()
+        while True:
+            batch = list(itertools.islice(products, FETCH_BATCH_SIZE))
+            if not batch:
+                break
+            sys.stdout.write(header + "".join(map(_INVENTORY_LINE, batch)))
+            header = ""
+        sys.stdout.write(header)
+        sys.stdout.flush()
 
-    def run_interactive(self):
+    def display_sales_report(self, page_size: Optional[int] = None) -> None:
+        """Displays sales report, writing each batch of lines to stdout at once.
+
+        With a page size, rows are fetched one page at a time and the user is asked
+        before the next page is read.
+        """
+        header = "\nSales Report:\n"
+        after_id = None
         while True:
-            print("\n🛍️ Store Management Menu")
-            print("1. Add new product")
-            print("2. Add product to storage")
-            print("3. Delete product")
-            print("4. Record store sale")
-            print("5. Record online sale")
-            print("6. Show current inventory")
-            print("7. Show sales report")
-            print("8. Exit")
-
-            choice = input("Enter your choice (1-8): ")
+            last_id, shown = None, 0
+            for batch in self.report.iter_sales_report_batches(after_id=after_id, limit=page_size):
+                sys.stdout.write(header + "".join(
+                    _REPORT_LINE(product_id, name, price, storage, store_sales, online_sales, total_sales,
+                                 _STATUS_LABELS[active])
+                    for product_id, name, price, storage, store_sales, online_sales, total_sales, active in batch
+                ))
+                header = ""
+                last_id, shown = batch[-1][0], shown + len(batch)
+            sys.stdout.write(header)
+            header = ""
+            sys.stdout.flush()
+            if page_size is None or shown < page_size:
+                break
+            if input("Press Enter for the next page, or 'q' to stop: ").strip().lower() == 'q':
+                break
+            after_id = last_id
 
-            try:
-                if choice == '1':
-                    name = input("Enter product name: ")
-                    price = float(input("Enter product price: "))
-                    product_id = self.add_new_product(name, price)
-                    print(f"✅ Product added with ProductID: {product_id}")
-
-                elif choice == '2':
-                    product_id = int(input("Enter ProductID: "))
-                    if not self.store.check_product_exists(product_id):
-                        print(f"❌ Error: ProductID {product_id} does not exist.")
-                        continue
-                    quantity = int(input("Enter quantity to add: "))
-                    if quantity <= 0:
-                        print("❌ Quantity must be greater than 0.")
-                        continue
-                    self.add_product_to_inventory(product_id, quantity)
-
-                elif choice == '3':
-                    product_id = int(input("Enter ProductID to delete: "))
-                    confirm = input(f"⚠️ Are you sure you want to deactivate ProductID {product_id}? (yes/no): ").strip().lower()
-                    if confirm == 'yes':
-                        self.storage.delete_product(product_id)
-                    else:
-                        print("❌ Deactivation cancelled.")
-
-                elif choice == '4':
-                    product_id = int(input("Enter ProductID: "))
-                    quantity = int(input("Enter quantity sold (store): "))
-                    self.record_store_sale(product_id, quantity)
-
-                elif choice == '5':
-                    product_id = int(input("Enter ProductID: "))
-                    quantity = int(input("Enter quantity sold (online): "))
-                    self.record_online_sale(product_id, quantity)
-
-                elif choice == '6':
-                    self.display_inventory()
-
-                elif choice == '7':
-                    self.display_sales_report()
-
-                elif choice == '8':
-                    print("👋 Exiting the program...")
+    def run_batch(self, stream: TextIO) -> None:
+        """Applies commands read from a stream in one transaction.
+
+        Each line is `ADD_STOCK <ProductID> <Quantity>`, `STORE_SALE <ProductID> <Quantity>`
+        or `ONLINE_SALE <ProductID> <Quantity>`; blank lines and lines starting with `#`
+        are skipped. Stock additions are applied before sales so a batch can restock
+        and sell the same product.
+        """
+        batches = {"ADD_STOCK": [], "STORE_SALE": [], "ONLINE_SALE": []}
+        for line_no, line in enumerate(stream, 1):
+            parts = line.split()
+            if not parts or parts[0].startswith("#"):
+                continue
+            command = parts[0].upper()
+            if command not in batches or len(parts) != 3:
+                raise ValueError(f"Line {line_no}: expected '<COMMAND> <ProductID> <Quantity>', got {line.strip()!r}")
+            if not _INT_RE.fullmatch(parts[1]) or not _INT_RE.fullmatch(parts[2]):
+                raise ValueError(f"Line {line_no}: ProductID and Quantity must be whole numbers, got {line.strip()!r}")
+            batches[command].append((int(parts[1]), int(parts[2])))
+
+        with self.batch():
+            if batches["ADD_STOCK"]:
+                self.storage.add_products_bulk(batches["ADD_STOCK"])
+            if batches["STORE_SALE"]:
+                self.store.record_sales_bulk(batches["STORE_SALE"])
+            if batches["ONLINE_SALE"]:
+                self.online_shop.record_sales_bulk(batches["ONLINE_SALE"])
+        print(f"✅ Batch applied: {len(batches['ADD_STOCK'])} stock additions, "
+              f"{len(batches['STORE_SALE'])} store sales, {len(batches['ONLINE_SALE'])} online sales.")
+
+    def add_products_interactive(self) -> None:
+        """Reads `name, price, quantity` lines until a blank one, then saves them in one transaction.
+
+        Any bad line or Ctrl+C discards everything entered so far.
+        """
+        print("Enter one product per line as: name, price, quantity. Leave a line empty to save.")
+        products: List[Tuple[str, float]] = []
+        quantities: List[int] = []
+        try:
+            while True:
+                line = input("> ").strip()
+                if not line:
                     break
+                parts = [part.strip() for part in line.rsplit(",", 2)]
+                if len(parts) != 3 or not _FLOAT_RE.fullmatch(parts[1]) or not _INT_RE.fullmatch(parts[2]):
+                    raise ValueError(f"Expected 'name, price, quantity', got {line!r}.")
+                quantity = int(parts[2])
+                if quantity < 0:
+                    raise ValueError("Quantity cannot be negative.")
+                products.append((parts[0], float(parts[1])))
+                quantities.append(quantity)
+        except KeyboardInterrupt:
+            print("\n❌ Cancelled; nothing was saved.")
+            return
+        if not products:
+            return
+        # The write lock is only taken once every line has been read and checked.
+        with self.batch():
+            product_ids = self.add_new_products_bulk(products)
+            self.add_products_to_inventory_bulk(
+                [(product_id, quantity) for product_id, quantity in zip(product_ids, quantities) if quantity])
+        print(f"✅ {len(products)} products saved.")
 
-                else:
-                    print("❌ Invalid choice. Please enter a number between 1 and 8.")
+    def _menu_add_new_product(self) -> None:
+        name = input("Enter product name: ")
+        price = _read_float("Enter product price: ")
+        product_id = self.add_new_product(name, price)
+        print(f"✅ Product added with ProductID: {product_id}")
 
+    def _menu_add_to_storage(self) -> None:
+        product_id = _read_int("Enter ProductID: ")
+        if not self.storage.check_product_exists(product_id):
+            print(f"❌ Error: ProductID {product_id} does not exist.")
+            return
+        quantity = _read_int("Enter quantity to add: ")
+        if quantity <= 0:
+            print("❌ Quantity must be greater than 0.")
+            return
+        self.add_product_to_inventory(product_id, quantity)
+
+    def _menu_delete_product(self) -> None:
+        product_id = _read_int("Enter ProductID to delete: ")
+        confirm = input(f"⚠️ Are you sure you want to deactivate ProductID {product_id}? (yes/no): ").strip().lower()
+        if confirm == 'yes':
+            self.storage.delete_product(product_id)
+        else:
+            print("❌ Deactivation cancelled.")
+
+    def _menu_store_sale(self) -> None:
+        product_id = _read_int("Enter ProductID: ")
+        quantity = _read_int("Enter quantity sold (store): ")
+        self.record_store_sale(product_id, quantity)
+
+    def _menu_online_sale(self) -> None:
+        product_id = _read_int("Enter ProductID: ")
+        quantity = _read_int("Enter quantity sold (online): ")
+        self.record_online_sale(product_id, quantity)
+
+    def _menu_sales_report(self) -> None:
+        page_size = _read_int(f"Rows per page (default {REPORT_PAGE_SIZE}): ", REPORT_PAGE_SIZE)
+        if page_size <= 0:
+            print("❌ Page size must be greater than 0.")
+            return
+        self.display_sales_report(page_size)
+
+    def _menu_exit(self) -> bool:
+        print("👋 Exiting the program...")
+        return True
+
+    def _menu_batch_file(self) -> None:
+        path = input("Enter batch file path: ").strip()
+        with open(path, encoding="utf-8") as stream:
+            self.run_batch(stream)
+
+    def _menu_entries(self) -> List[Tuple[str, str, Callable[[], Optional[bool]]]]:
+        """The interactive menu as (key, label, handler); a handler returning True ends the loop."""
+        return [
+            ('1', "Add new product", self._menu_add_new_product),
+            ('2', "Add product to storage", self._menu_add_to_storage),
+            ('3', "Delete product", self._menu_delete_product),
+            ('4', "Record store sale", self._menu_store_sale),
+            ('5', "Record online sale", self._menu_online_sale),
+            ('6', "Show current inventory", self.display_inventory),
+            ('7', "Show sales report", self._menu_sales_report),
+            ('8', "Exit", self._menu_exit),
+            ('B', "Run a batch file", self._menu_batch_file),
+            ('M', "Add several products", self.add_products_interactive),
+            ('R', "Rebuild sales totals", self.rebuild_sales_totals),
+        ]
+
+    def run_interactive(self):
+        entries = self._menu_entries()
+        handlers = {key: handler for key, _, handler in entries}
+        menu = "\n🛍️ Store Management Menu\n" + "".join(f"{key}. {label}\n" for key, label, _ in entries)
+        while True:
+            sys.stdout.write(menu)
+            choice = input("Enter your choice (1-8, B, M, R): ").strip().upper()
+            handler = handlers.get(choice)
+            if handler is None:
+                print("❌ Invalid choice. Please enter a number between 1 and 8, B, M or R.")
+                continue
+            try:
+                if handler():
+                    break
             except ValueError as e:
                 print(f"⚠️ Invalid input: {e}")
             except Exception as e:
                 print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     app = StoreApp("store.db")
 
     try:
         app.start()
-        app.run_interactive()
+        if "--batch" in sys.argv[1:]:
+            app.run_batch(sys.stdin)
+        else:
+            app.run_interactive()
     finally:
         app.stop()
\ No newline at end of file
@@ -16,10 +16,11 @@ CREATE TABLE IF NOT EXISTS Storage (
     FOREIGN KEY (ProductID) REFERENCES Products(ProductID)
 );
 
+-- SaleDate توسط پیش‌فرض ستون ثبت می‌شود (میلی‌ثانیه از مبدأ یونیکس، UTC)؛ برنامه تاریخ را ارسال نمی‌کند
 CREATE TABLE IF NOT EXISTS StoreSales (
     SaleID INTEGER PRIMARY KEY AUTOINCREMENT,
     ProductID INTEGER NOT NULL,
-    SaleDate TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    SaleDate INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
     Quantity INTEGER NOT NULL CHECK (Quantity > 0),
     FOREIGN KEY (ProductID) REFERENCES Products(ProductID)
 );
@@ -27,11 +28,37 @@ CREATE TABLE IF NOT EXISTS StoreSales (
 CREATE TABLE IF NOT EXISTS OnlineSales (
     SaleID INTEGER PRIMARY KEY AUTOINCREMENT,
     ProductID INTEGER NOT NULL,
-    SaleDate TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    SaleDate INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
     Quantity INTEGER NOT NULL CHECK (Quantity > 0),
     FOREIGN KEY (ProductID) REFERENCES Products(ProductID)
 );
 
+-- ایندکس‌ها
+CREATE UNIQUE INDEX IF NOT EXISTS IX_Storage_ProductID ON Storage(ProductID);
+-- ایندکس پوششی تا خواندن موجودی بدون مراجعه به جدول انجام شود
+CREATE INDEX IF NOT EXISTS IX_Storage_ProductID_Quantity ON Storage(ProductID, Quantity);
+CREATE INDEX IF NOT EXISTS IX_StoreSales_ProductID ON StoreSales(ProductID, Quantity);
+CREATE INDEX IF NOT EXISTS IX_OnlineSales_ProductID ON OnlineSales(ProductID, Quantity);
+
+-- جمع فروش هر محصول که با تریگرها به‌روز نگه داشته می‌شود (برای گزارش فروش)
+CREATE TABLE IF NOT EXISTS SalesTotals (
+    ProductID INTEGER PRIMARY KEY,
+    StoreQuantity INTEGER NOT NULL DEFAULT 0,
+    OnlineQuantity INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (ProductID) REFERENCES Products(ProductID)
+);
+
+-- نماهای خوانا برای تاریخ فروش (دیتابیس‌های قدیمی‌تر تاریخ را به صورت متن دارند)
+CREATE VIEW IF NOT EXISTS StoreSalesISO AS
+SELECT SaleID, ProductID, Quantity,
+       CASE typeof(SaleDate) WHEN 'integer' THEN datetime(SaleDate / 1000, 'unixepoch') ELSE SaleDate END AS SaleDate
+FROM StoreSales;
+
+CREATE VIEW IF NOT EXISTS OnlineSalesISO AS
+SELECT SaleID, ProductID, Quantity,
+       CASE typeof(SaleDate) WHEN 'integer' THEN datetime(SaleDate / 1000, 'unixepoch') ELSE SaleDate END AS SaleDate
+FROM OnlineSales;
+
 -- تریگرهای کاهش موجودی
 CREATE TRIGGER IF NOT EXISTS trg_AfterStoreSale
 AFTER INSERT ON StoreSales
@@ -71,6 +98,49 @@ BEGIN
     WHERE ProductID = NEW.ProductID AND Quantity = 0;
 END;
 
+-- تریگرهای نگهداری جمع فروش
+CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_StoreSaleInsert
+AFTER INSERT ON StoreSales
+BEGIN
+    INSERT INTO SalesTotals (ProductID, StoreQuantity) VALUES (NEW.ProductID, NEW.Quantity)
+    ON CONFLICT(ProductID) DO UPDATE SET StoreQuantity = StoreQuantity + excluded.StoreQuantity;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_StoreSaleDelete
+AFTER DELETE ON StoreSales
+BEGIN
+    UPDATE SalesTotals SET StoreQuantity = StoreQuantity - OLD.Quantity WHERE ProductID = OLD.ProductID;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_StoreSaleUpdate
+AFTER UPDATE OF ProductID, Quantity ON StoreSales
+BEGIN
+    UPDATE SalesTotals SET StoreQuantity = StoreQuantity - OLD.Quantity WHERE ProductID = OLD.ProductID;
+    INSERT INTO SalesTotals (ProductID, StoreQuantity) VALUES (NEW.ProductID, NEW.Quantity)
+    ON CONFLICT(ProductID) DO UPDATE SET StoreQuantity = StoreQuantity + excluded.StoreQuantity;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_OnlineSaleInsert
+AFTER INSERT ON OnlineSales
+BEGIN
+    INSERT INTO SalesTotals (ProductID, OnlineQuantity) VALUES (NEW.ProductID, NEW.Quantity)
+    ON CONFLICT(ProductID) DO UPDATE SET OnlineQuantity = OnlineQuantity + excluded.OnlineQuantity;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_OnlineSaleDelete
+AFTER DELETE ON OnlineSales
+BEGIN
+    UPDATE SalesTotals SET OnlineQuantity = OnlineQuantity - OLD.Quantity WHERE ProductID = OLD.ProductID;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_SalesTotals_OnlineSaleUpdate
+AFTER UPDATE OF ProductID, Quantity ON OnlineSales
+BEGIN
+    UPDATE SalesTotals SET OnlineQuantity = OnlineQuantity - OLD.Quantity WHERE ProductID = OLD.ProductID;
+    INSERT INTO SalesTotals (ProductID, OnlineQuantity) VALUES (NEW.ProductID, NEW.Quantity)
+    ON CONFLICT(ProductID) DO UPDATE SET OnlineQuantity = OnlineQuantity + excluded.OnlineQuantity;
+END;
+
 -- داده‌های اولیه
 INSERT INTO Products (ProductName, Price) VALUES
     ('Laptop Pro', 1200.00),